@@ -26,13 +26,17 @@ import datetime as dt
 import math
 import os
 import csv
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 import requests
+from requests.adapters import HTTPAdapter
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 
-import base64
+import binascii
 import json
 
 
@@ -42,6 +46,12 @@ ET = ZoneInfo("America/Toronto")
 LOGO_PATH = r"stat_trick_logo.png"     # your logo file path
 ARENAS_CSV_PATH = "nhl_arenas.csv"     # team_abbr + lat/lon (recommended full header)
 
+# Fast PNG encode (compress_level=1) for the publish path; set IG_FAST_PNG=0 for smallest files
+IG_FAST_PNG = os.getenv("IG_FAST_PNG", "1") != "0"
+
+# Local schedule cache (one JSON per date); set NHL_CACHE_DIR="" to disable
+NHL_CACHE_DIR = os.getenv("NHL_CACHE_DIR", ".nhl_cache")
+
 
 # ============================================================
 # GitHub Publish (Contents API)
@@ -59,6 +69,11 @@ GITHUB_SUBDIR = "ig_pressure"
 GITHUB_USER_AGENT = os.getenv("GITHUB_USER_AGENT", "Mozilla/5.0 (compatible; GitHubPublisher/1.0)")
 
 
+# One pooled session for NHL + GitHub calls so TLS connections are reused
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20))
+
+
 # ============================================================
 # NHL API helpers
 # ============================================================
@@ -75,7 +90,7 @@ def _gh_headers() -> dict:
 
 def _gh_get_file_sha(owner: str, repo: str, path: str, branch: str) -> str | None:
     url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}?ref={branch}"
-    r = requests.get(url, headers=_gh_headers(), timeout=20)
+    r = _SESSION.get(url, headers=_gh_headers(), timeout=20)
     if r.status_code == 200:
         js = r.json()
         return js.get("sha")
@@ -87,17 +102,22 @@ def _gh_get_file_sha(owner: str, repo: str, path: str, branch: str) -> str | Non
 
 def gh_put_file(owner: str, repo: str, path: str, content_bytes: bytes, message: str, branch: str) -> dict:
     sha = _gh_get_file_sha(owner, repo, path, branch)
+    return _gh_put_file_with_sha(owner, repo, path, content_bytes, message, branch, sha)
+
+
+def _gh_put_file_with_sha(owner: str, repo: str, path: str, content_bytes: bytes, message: str, branch: str,
+                          sha: str | None) -> dict:
     url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}"
 
     payload = {
         "message": message,
-        "content": base64.b64encode(content_bytes).decode("utf-8"),
+        "content": binascii.b2a_base64(content_bytes, newline=False).decode("ascii"),
         "branch": branch,
     }
     if sha:
         payload["sha"] = sha
 
-    r = requests.put(url, headers=_gh_headers(), data=json.dumps(payload), timeout=30)
+    r = _SESSION.put(url, headers=_gh_headers(), data=json.dumps(payload), timeout=30)
     r.raise_for_status()
     return r.json()
 
@@ -106,16 +126,23 @@ def publish_images_to_github(image_paths: list[str], date_str: str) -> list[str]
     if not (GITHUB_OWNER and GITHUB_REPO and GITHUB_BRANCH):
         raise RuntimeError("Set GITHUB_OWNER, GITHUB_REPO, GITHUB_BRANCH to publish.")
 
+    repo_paths = [f"{GITHUB_PAGES_DIR}/{GITHUB_SUBDIR}/{os.path.basename(p)}".replace("\\", "/")
+                  for p in image_paths]
+
+    # sha lookups are read-only, so do them concurrently; PUTs stay serial because
+    # each one commits to the branch and parallel commits conflict on the ref
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        shas = list(ex.map(lambda rp: _gh_get_file_sha(GITHUB_OWNER, GITHUB_REPO, rp, GITHUB_BRANCH), repo_paths))
+
     uploaded_urls: list[str] = []
-    for p in image_paths:
+    for p, repo_path, sha in zip(image_paths, repo_paths, shas):
         fname = os.path.basename(p)
-        repo_path = f"{GITHUB_PAGES_DIR}/{GITHUB_SUBDIR}/{fname}".replace("\\", "/")
 
         with open(p, "rb") as f:
             b = f.read()
 
         msg = f"Publish schedule pressure images ({date_str}): {fname}"
-        resp = gh_put_file(GITHUB_OWNER, GITHUB_REPO, repo_path, b, msg, GITHUB_BRANCH)
+        resp = _gh_put_file_with_sha(GITHUB_OWNER, GITHUB_REPO, repo_path, b, msg, GITHUB_BRANCH, sha)
 
         pages_url = f"https://{GITHUB_OWNER}.github.io/{GITHUB_REPO}/{repo_path.replace(GITHUB_PAGES_DIR+'/', '')}"
         download_url = (resp.get("content") or {}).get("download_url")
@@ -126,13 +153,62 @@ def publish_images_to_github(image_paths: list[str], date_str: str) -> list[str]
 
 
 def _get_json(url: str, timeout: int = 20) -> dict:
-    r = requests.get(url, timeout=timeout)
+    r = _SESSION.get(url, timeout=timeout)
     r.raise_for_status()
     return r.json()
 
 
+def _get_schedule_json(date_yyyy_mm_dd: str, timeout: int = 20) -> dict:
+    url = f"{API}/schedule/{date_yyyy_mm_dd}"
+    if not NHL_CACHE_DIR:
+        return _get_json(url, timeout=timeout)
+
+    cache_path = os.path.join(NHL_CACHE_DIR, f"schedule_{date_yyyy_mm_dd}.json")
+    cached = None
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        cached = None
+    if not isinstance(cached, dict) or "data" not in cached:
+        cached = None
+
+    # a copy is final only if it was fetched after day D closed (fetched > D + 1);
+    # anything older (e.g. a pre-game copy from D's morning) is revalidated
+    day = dt.date.fromisoformat(date_yyyy_mm_dd)
+    today = dt.datetime.now(ET).date()
+    if cached:
+        try:
+            fetched = dt.date.fromisoformat(str(cached.get("fetched", "")))
+        except ValueError:
+            fetched = None
+        if fetched and fetched > day + dt.timedelta(days=1):
+            return cached["data"]
+
+    headers = {"If-None-Match": cached["etag"]} if cached and cached.get("etag") else {}
+    r = _SESSION.get(url, headers=headers, timeout=timeout)
+    if r.status_code == 304 and cached:
+        js = cached["data"]
+        etag = cached.get("etag")
+    else:
+        r.raise_for_status()
+        js = r.json()
+        etag = r.headers.get("ETag")
+
+    try:
+        os.makedirs(NHL_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"etag": etag, "fetched": today.isoformat(), "data": js}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+    return js
+
+
 def fetch_schedule(date_yyyy_mm_dd: str) -> list[dict]:
-    js = _get_json(f"{API}/schedule/{date_yyyy_mm_dd}")
+    js = _get_schedule_json(date_yyyy_mm_dd)
 
     games: list[dict] = []
     if isinstance(js, dict):
@@ -143,20 +219,25 @@ def fetch_schedule(date_yyyy_mm_dd: str) -> list[dict]:
         if not games and "games" in js and isinstance(js["games"], list):
             games = js["games"]
 
+    for g in games:
+        _game_teams(g)
+
     return games
 
 
 def fetch_schedules_for_range(start_date: dt.date, end_date: dt.date) -> dict[str, list[dict]]:
-    out: dict[str, list[dict]] = {}
-    cur = start_date
-    while cur <= end_date:
-        ds = cur.isoformat()
+    n_days = (end_date - start_date).days + 1
+    date_strs = [(start_date + dt.timedelta(days=i)).isoformat() for i in range(max(n_days, 0))]
+
+    def _fetch_or_empty(ds: str) -> list[dict]:
         try:
-            out[ds] = fetch_schedule(ds)
+            return fetch_schedule(ds)
         except Exception:
-            out[ds] = []
-        cur += dt.timedelta(days=1)
-    return out
+            return []
+
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        results = ex.map(_fetch_or_empty, date_strs)
+        return dict(zip(date_strs, results))
 
 
 # ============================================================
@@ -205,17 +286,35 @@ def load_arenas_latlon(path: str) -> dict[str, tuple[float, float]]:
     return m
 
 
+_EARTH_R_KM = 6371.0
+
+
+def _haversine_km_rad(phi1: float, lam1: float, phi2: float, lam2: float, cos1: float, cos2: float) -> float:
+    # numeric kernel: inputs already in radians, cos(phi) precomputed by the caller
+    a = math.sin((phi2 - phi1) / 2.0) ** 2 + cos1 * cos2 * math.sin((lam2 - lam1) / 2.0) ** 2
+    return 2 * _EARTH_R_KM * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
 def haversine_km(lat1, lon1, lat2, lon2) -> float:
     if lat1 is None or lon1 is None or lat2 is None or lon2 is None:
         return float("nan")
-    R = 6371.0
     phi1 = math.radians(lat1)
     phi2 = math.radians(lat2)
-    dphi = math.radians(lat2 - lat1)
-    dlambda = math.radians(lon2 - lon1)
-    a = math.sin(dphi / 2.0) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2.0) ** 2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    return R * c
+    return _haversine_km_rad(phi1, math.radians(lon1), phi2, math.radians(lon2), math.cos(phi1), math.cos(phi2))
+
+
+def _to_rad(lat: float, lon: float) -> tuple[float, float, float]:
+    phi = math.radians(lat)
+    return phi, math.radians(lon), math.cos(phi)
+
+
+def _path_km_rad(pts: list[tuple[float, float, float]]) -> float:
+    km_sum = 0.0
+    for (phi1, lam1, cos1), (phi2, lam2, cos2) in zip(pts[:-1], pts[1:]):
+        km = _haversine_km_rad(phi1, lam1, phi2, lam2, cos1, cos2)
+        if not math.isnan(km):
+            km_sum += km
+    return km_sum
 
 
 # ============================================================
@@ -241,17 +340,31 @@ def _team_abbrev(team_obj: dict) -> str:
     return "UNK"
 
 
+def _game_teams(game: dict) -> tuple[str, str]:
+    # abbrevs are stashed on the game dict the first time so later lookups are free
+    if "_away_ab" not in game:
+        game["_away_ab"] = _team_abbrev(game.get("awayTeam") or {})
+        game["_home_ab"] = _team_abbrev(game.get("homeTeam") or {})
+    return game["_away_ab"], game["_home_ab"]
+
+
 def _fmt_local_time(game: dict, tz: ZoneInfo = ET) -> str:
     s = game.get("startTimeUTC") or game.get("startTime") or ""
     if not s:
         return ""
+    return _fmt_local_time_cached(s, tz)
+
+
+@lru_cache(maxsize=256)
+def _fmt_local_time_cached(s: str, tz: ZoneInfo) -> str:
     try:
         if s.endswith("Z"):
             s = s.replace("Z", "+00:00")
         dt_utc = dt.datetime.fromisoformat(s)
         dt_loc = dt_utc.astimezone(tz)
-        hour_fmt = "%#I:%M %p" if os.name == "nt" else "%-I:%M %p"
-        return dt_loc.strftime(hour_fmt)
+        # formatted by hand: strftime's "%-I" is not portable ("%#I" on Windows)
+        hh = dt_loc.hour % 12 or 12
+        return f"{hh}:{dt_loc.minute:02d} {'PM' if dt_loc.hour >= 12 else 'AM'}"
     except Exception:
         return ""
 
@@ -266,83 +379,64 @@ def compute_team_loads(
     today_game_by_team: dict[str, dict] = {}
 
     for g in day_games:
-        away = _team_abbrev(g.get("awayTeam") or {})
-        home = _team_abbrev(g.get("homeTeam") or {})
+        away, home = _game_teams(g)
         teams_today.update([away, home])
         today_game_by_team.setdefault(away, g)
         today_game_by_team.setdefault(home, g)
 
-    def game_teams(gg: dict) -> tuple[str, str]:
-        a = _team_abbrev(gg.get("awayTeam") or {})
-        h = _team_abbrev(gg.get("homeTeam") or {})
-        return a, h
-
-    def count_games_for_team(team: str, start: dt.date, end: dt.date) -> int:
-        n = 0
-        cur = start
-        while cur <= end:
-            ds = cur.isoformat()
-            for gg in schedules_by_date.get(ds, []):
-                a, h = game_teams(gg)
-                if team in (a, h):
-                    n += 1
-            cur += dt.timedelta(days=1)
-        return n
-
-    def venue_latlon_for_game(gg: dict) -> tuple[float, float] | None:
-        if not arenas_latlon:
-            return None
-        _, home = game_teams(gg)
-        return arenas_latlon.get(home)
+    # arena coords pre-flattened to (phi, lambda, cos(phi)) once per call, not per segment
+    arenas_rad: dict[str, tuple[float, float, float]] = {
+        ab: _to_rad(lat, lon) for ab, (lat, lon) in (arenas_latlon or {}).items()
+    }
 
-    def travel_km_last_7_days(team: str) -> float | None:
-        if not arenas_latlon:
-            return None
+    # struct-of-arrays per team, built in one pass over the schedules:
+    # sorted game-date ordinals and the matching home-venue coords (None if unknown)
+    team_ords: dict[str, list[int]] = {}
+    team_venues: dict[str, list[tuple[float, float, float] | None]] = {}
+    for ds in sorted(schedules_by_date.keys()):
+        dord = dt.date.fromisoformat(ds).toordinal()
+        for gg in schedules_by_date.get(ds, []):
+            a, h = _game_teams(gg)
+            venue = arenas_rad.get(h)
+            for tm in {a, h}:
+                team_ords.setdefault(tm, []).append(dord)
+                team_venues.setdefault(tm, []).append(venue)
+
+    def played_last_6_days(team: str) -> list[int]:
+        # games per day for [target-5 .. target]; index 4 is yesterday, 5 is today
+        ords = team_ords.get(team, [])
+        first = target_date.toordinal() - 5
+        played = [0] * 6
+        for o in ords[bisect_left(ords, first):bisect_right(ords, first + 5)]:
+            played[o - first] += 1
+        return played
 
+    def travel_km_last_7_days(team: str) -> float | None:
         start_day = target_date - dt.timedelta(days=6)
 
-        games_window: list[tuple[dt.date, dict]] = []
-        for ds in sorted(schedules_by_date.keys()):
-            dcur = dt.date.fromisoformat(ds)
-            if start_day <= dcur <= target_date:
-                for gg in schedules_by_date.get(ds, []):
-                    a, h = game_teams(gg)
-                    if team in (a, h):
-                        games_window.append((dcur, gg))
+        ords = team_ords.get(team, [])
+        lo = bisect_left(ords, start_day.toordinal())
+        hi = bisect_right(ords, target_date.toordinal())
 
-        if len(games_window) < 2:
+        if hi - lo < 2:
             return None
 
-        games_window.sort(key=lambda x: x[0])
-        venues: list[tuple[float, float]] = []
-        for _, gg in games_window:
-            ll = venue_latlon_for_game(gg)
-            if ll:
-                venues.append(ll)
+        venues = [v for v in team_venues[team][lo:hi] if v]
 
         if len(venues) < 2:
             return None
 
-        km_sum = 0.0
-        for (lat1, lon1), (lat2, lon2) in zip(venues[:-1], venues[1:]):
-            km = haversine_km(lat1, lon1, lat2, lon2)
-            if not math.isnan(km):
-                km_sum += km
-
-        return float(km_sum)
+        return float(_path_km_rad(venues))
 
     loads: dict[str, TeamLoad] = {}
-    d = target_date
-    d_yday = d - dt.timedelta(days=1)
-
-    w3_start = d - dt.timedelta(days=3)
-    w6_start = d - dt.timedelta(days=5)
+    arenas_ok = bool(arenas_latlon)
 
     for t in sorted(teams_today):
-        g_yday = count_games_for_team(t, d_yday, d_yday)
-        g3 = count_games_for_team(t, w3_start, d)
-        g6 = count_games_for_team(t, w6_start, d)
-        tkm = travel_km_last_7_days(t)
+        played = played_last_6_days(t)
+        g_yday = played[4]
+        g3 = sum(played[2:])
+        g6 = sum(played)
+        tkm = travel_km_last_7_days(t) if arenas_ok else None
 
         loads[t] = TeamLoad(
             team=t,
@@ -359,6 +453,7 @@ def compute_team_loads(
 # Rendering (PIL)
 # ============================================================
 
+@lru_cache(maxsize=32)
 def _load_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
     candidates = []
     if os.name == "nt":
@@ -379,13 +474,19 @@ def _load_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
     return ImageFont.load_default()
 
 
+@lru_cache(maxsize=512)
+def _text_w(text: str, font: ImageFont.FreeTypeFont) -> float:
+    # chip labels repeat a lot (B2B:N, 3IN4:1, ...) so measure each once
+    return font.getlength(text)
+
+
 def _rounded_rect(draw: ImageDraw.ImageDraw, xy, r: int, fill=None, outline=None, width: int = 1):
     draw.rounded_rectangle(list(xy), radius=r, fill=fill, outline=outline, width=width)
 
 
 def _chip(draw: ImageDraw.ImageDraw, x: int, y: int, text: str, font: ImageFont.ImageFont,
           fill, outline, text_fill, pad_x=12, pad_y=6, r=14):
-    tw = draw.textlength(text, font=font)
+    tw = _text_w(text, font)
     th = font.size
     w = int(tw + pad_x * 2)
     h = int(th + pad_y * 2)
@@ -395,24 +496,40 @@ def _chip(draw: ImageDraw.ImageDraw, x: int, y: int, text: str, font: ImageFont.
 
 
 def _soft_shadow(base_rgba, rect, r=28, offset=(0, 10), shadow_color=(0, 0, 0, 140), blur=22):
+    # blur only a tight tile around the rect (3*blur covers the Gaussian tail), then blend it in place
     x0, y0, x1, y1 = rect
-    shadow = Image.new("RGBA", base_rgba.size, (0, 0, 0, 0))
-    sd = ImageDraw.Draw(shadow)
-    sd.rounded_rectangle([x0 + offset[0], y0 + offset[1], x1 + offset[0], y1 + offset[1]],
-                         radius=r, fill=shadow_color)
-    shadow = shadow.filter(ImageFilter.GaussianBlur(blur))
-    return Image.alpha_composite(base_rgba, shadow)
+    pad = 3 * blur
+    w = x1 - x0 + 2 * pad
+    h = y1 - y0 + 2 * pad
+    # the color is flat, so only the alpha needs blurring: blur a 1-band mask, not 4 bands
+    mask = Image.new("L", (w, h), 0)
+    md = ImageDraw.Draw(mask)
+    md.rounded_rectangle([pad, pad, w - pad, h - pad], radius=r, fill=shadow_color[3])
+    shadow = Image.new("RGBA", (w, h), tuple(shadow_color[:3]) + (0,))
+    shadow.putalpha(mask.filter(ImageFilter.GaussianBlur(blur)))
+
+    dx = x0 + offset[0] - pad
+    dy = y0 + offset[1] - pad
+    sx, sy = max(0, -dx), max(0, -dy)
+    base_rgba.alpha_composite(shadow, dest=(dx + sx, dy + sy), source=(sx, sy))
+    return base_rgba
 
 
+@lru_cache(maxsize=8)
 def _circle_logo(logo_path, size=52, opacity=90):
-    logo = Image.open(logo_path).convert("RGBA").resize((size, size))
+    logo = Image.open(logo_path)
+    logo.draft(None, (size * 2, size * 2))  # JPEG decodes straight at a reduced scale; no-op for PNG
+    if logo.mode != "RGBA":
+        logo = logo.convert("RGBA")
+    logo = logo.resize((size, size), Image.Resampling.LANCZOS)
 
     mask = Image.new("L", (size, size), 0)
     md = ImageDraw.Draw(mask)
     md.ellipse((0, 0, size - 1, size - 1), fill=255)
     logo.putalpha(mask)
 
-    alpha = logo.split()[-1].point(lambda p: int(p * (opacity / 255)))
+    lut = [int(p * (opacity / 255)) for p in range(256)]
+    alpha = logo.getchannel("A").point(lut)
     logo.putalpha(alpha)
     return logo
 
@@ -425,30 +542,33 @@ def _fmt_km_compact(km: float | None) -> str:
     return f"{km/1000.0:.1f}k"
 
 
-def render_schedule_pressure_card(date_str: str, games: list[dict], loads: dict[str, TeamLoad], out_path: str):
-    W, H = 1080, 1080
+W, H = 1080, 1080
 
-    BG     = (11, 15, 20)
-    CARD   = (16, 24, 36)
-    CARD2  = (18, 28, 42)
-    BORDER = (35, 52, 72)
-    TEAL   = (59, 214, 198)
-    TEXT   = (234, 242, 255)
-    MUTED  = (156, 170, 190)
-    HOT    = (255, 107, 107)
+BG     = (11, 15, 20)
+CARD   = (16, 24, 36)
+CARD2  = (18, 28, 42)
+BORDER = (35, 52, 72)
+TEAL   = (59, 214, 198)
+TEXT   = (234, 242, 255)
+MUTED  = (156, 170, 190)
+HOT    = (255, 107, 107)
 
+HEADER_BOX = (45, 40, W - 45, 245)
+MAIN_BOX   = (45, 275, W - 45, 910)
+FOOTER_BOX = (45, 935, W - 45, 1035)
+
+
+def _build_template(date_str: str) -> Image.Image:
+    # background, header and main panel with its legend; the footer is a separate tile (see below)
     img = Image.new("RGBA", (W, H), BG)
     d = ImageDraw.Draw(img)
 
     f_title = _load_font(54, bold=True)
     f_sub   = _load_font(26, bold=False)
-    f_row   = _load_font(34, bold=True)
-    f_small = _load_font(22, bold=False)
     f_chip  = _load_font(20, bold=True)
 
-    header = (45, 40, W - 45, 245)
-    img = _soft_shadow(img, header, r=34)
-    d = ImageDraw.Draw(img)
+    header = HEADER_BOX
+    _soft_shadow(img, header, r=34)
     _rounded_rect(d, header, r=34, fill=CARD, outline=BORDER, width=3)
     d.rectangle([header[0] + 22, header[1] + 24, header[2] - 22, header[1] + 40], fill=TEAL)
 
@@ -457,9 +577,8 @@ def render_schedule_pressure_card(date_str: str, games: list[dict], loads: dict[
            f"{date_str} • All Games • TRVL + Density flags (B2B / 3IN4 / 4IN6)",
            font=f_sub, fill=MUTED)
 
-    main = (45, 275, W - 45, 910)
-    img = _soft_shadow(img, main, r=34)
-    d = ImageDraw.Draw(img)
+    main = MAIN_BOX
+    _soft_shadow(img, main, r=34)
     _rounded_rect(d, main, r=34, fill=CARD, outline=BORDER, width=3)
 
     lx, ly = main[0] + 28, main[1] + 22
@@ -467,10 +586,54 @@ def render_schedule_pressure_card(date_str: str, games: list[dict], loads: dict[
     _chip(d, lx, ly, "B2B = played yesterday", f_chip, CARD2, BORDER, TEXT); lx = main[0] + 28; ly += 46
     _chip(d, lx, ly, "3IN4 / 4IN6 include today", f_chip, CARD2, BORDER, TEXT)
 
+    return img
+
+
+@lru_cache(maxsize=1)
+def _build_footer_tile() -> tuple[Image.Image, tuple[int, int]]:
+    # footer shadow + panel + logo on a transparent layer, cropped to what it covers.
+    # Pasted after the game rows so the footer stays on top of rows that overflow
+    # the main panel (e.g. --per 6). The footer text is drawn per slide afterwards:
+    # its descenders hang past the panel edge and must blend with the slide itself.
+    img = Image.new("RGBA", (W, H), (0, 0, 0, 0))
+    d = ImageDraw.Draw(img)
+
+    footer = FOOTER_BOX
+    _soft_shadow(img, footer, r=34)
+    _rounded_rect(d, footer, r=34, fill=CARD, outline=BORDER, width=3)
+    d.rectangle([footer[0] + 22, footer[1] + 22, footer[2] - 22, footer[1] + 38], fill=TEAL)
+
+    try:
+        logo_size = 52
+        logo = _circle_logo(LOGO_PATH, size=logo_size, opacity=90)
+        lx = footer[2] - 28 - logo_size
+        ly = footer[3] - 8 - logo_size
+        img.alpha_composite(logo, (lx, ly))
+    except Exception:
+        pass
+
+    box = img.getbbox()
+    return img.crop(box), (box[0], box[1])
+
+
+def render_schedule_pressure_card(date_str: str, games: list[dict], loads: dict[str, TeamLoad], out_path: str,
+                                  already_sorted: bool = False, template: Image.Image | None = None):
+    if template is None:
+        template = _build_template(date_str)
+    img = template.copy()
+    d = ImageDraw.Draw(img)
+
+    f_row   = _load_font(34, bold=True)
+    f_small = _load_font(22, bold=False)
+    f_chip  = _load_font(20, bold=True)
+    f_foot  = _load_font(28, bold=True)
+
+    main = MAIN_BOX
+
     if not games:
         d.text((main[0] + 28, main[1] + 140), "No games found for this date.", font=f_row, fill=TEXT)
     else:
-        games_sorted = sorted(games, key=lambda g: g.get("startTimeUTC") or "")
+        games_sorted = games if already_sorted else sorted(games, key=lambda g: g.get("startTimeUTC") or "")
 
         x_left = main[0] + 28
         x_right = main[2] - 28
@@ -479,8 +642,7 @@ def render_schedule_pressure_card(date_str: str, games: list[dict], loads: dict[
         sep = (40, 55, 75)
 
         for i, g in enumerate(games_sorted):
-            away = _team_abbrev(g.get("awayTeam") or {})
-            home = _team_abbrev(g.get("homeTeam") or {})
+            away, home = _game_teams(g)
             t = _fmt_local_time(g, ET)
 
             if i > 0:
@@ -510,7 +672,7 @@ def render_schedule_pressure_card(date_str: str, games: list[dict], loads: dict[
                 curx = x_right
                 for kind, val, hot in chips:
                     txt = f"{kind}:{val}"
-                    tw = d.textlength(txt, font=f_chip)
+                    tw = _text_w(txt, f_chip)
                     w = int(tw + 14 * 2)
                     curx -= w
                     _chip(
@@ -530,27 +692,19 @@ def render_schedule_pressure_card(date_str: str, games: list[dict], loads: dict[
 
             y += row_h
 
-    footer = (45, 935, W - 45, 1035)
-    img = _soft_shadow(img, footer, r=34)
-    d = ImageDraw.Draw(img)
-    _rounded_rect(d, footer, r=34, fill=CARD, outline=BORDER, width=3)
-    d.rectangle([footer[0] + 22, footer[1] + 22, footer[2] - 22, footer[1] + 38], fill=TEAL)
+    footer = FOOTER_BOX
+    footer_tile, footer_pos = _build_footer_tile()
+    img.alpha_composite(footer_tile, footer_pos)
 
-    d.text((footer[0] + 28, footer[1] + 46), "Fatigue Watch", font=_load_font(28, bold=True), fill=TEXT)
+    d.text((footer[0] + 28, footer[1] + 46), "Fatigue Watch", font=f_foot, fill=TEXT)
     d.text((footer[0] + 28, footer[1] + 78),
            "• Slower legs late   • Transition gaps   • Late penalties",
-           font=_load_font(22, bold=False), fill=MUTED)
+           font=f_small, fill=MUTED)
 
-    try:
-        logo_size = 52
-        logo = _circle_logo(LOGO_PATH, size=logo_size, opacity=90)
-        lx = footer[2] - 28 - logo_size
-        ly = footer[3] - 8 - logo_size
-        img.alpha_composite(logo, (lx, ly))
-    except Exception:
-        pass
-
-    img.convert("RGB").save(out_path)
+    if IG_FAST_PNG:
+        img.convert("RGB").save(out_path, format="PNG", compress_level=1, optimize=False)
+    else:
+        img.convert("RGB").save(out_path)
     print(f"✅ Wrote: {out_path}")
 
 
@@ -560,17 +714,18 @@ def render_schedule_pressure_carousel(date_str: str, games: list[dict], loads: d
 
     games_sorted = sorted(games, key=lambda g: g.get("startTimeUTC") or "")
     paths: list[str] = []
+    template = _build_template(date_str)
 
     if not games_sorted:
         out_path = os.path.join(out_dir, f"ig_schedule_pressure_{date_str}_p1.png")
-        render_schedule_pressure_card(date_str, [], loads, out_path)
+        render_schedule_pressure_card(date_str, [], loads, out_path, template=template)
         return [out_path]
 
     for i in range(0, len(games_sorted), max_games_per_slide):
         chunk = games_sorted[i:i + max_games_per_slide]
         slide_n = (i // max_games_per_slide) + 1
         out_path = os.path.join(out_dir, f"ig_schedule_pressure_{date_str}_p{slide_n}.png")
-        render_schedule_pressure_card(date_str, chunk, loads, out_path)
+        render_schedule_pressure_card(date_str, chunk, loads, out_path, already_sorted=True, template=template)
         paths.append(out_path)
 
     return paths